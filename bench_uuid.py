@@ -0,0 +1,125 @@
+"""
+pytest-benchmark suite comparing rust_uuid with the Python uuid module.
+
+Run with:
+    pytest bench_uuid.py --benchmark-columns=min,mean,stddev,ops \
+        --benchmark-min-rounds=1000 --benchmark-warmup=on \
+        --benchmark-json=results.json
+
+and print the comparison table with:
+    python benchmark_uuid.py --summarize results.json
+"""
+
+import uuid as python_uuid
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+rust_uuid = pytest.importorskip("rust_uuid")
+
+try:
+    import uuid_utils
+except ImportError:
+    uuid_utils = None
+
+# Python uuid7 baseline, chosen once: stdlib on 3.14+, else uuid_utils
+PYTHON_UUID7 = getattr(python_uuid, "uuid7", None) or getattr(uuid_utils, "uuid7", None)
+
+TEST_NAME = "example.com"
+
+
+# Python baselines are wrapped in str() since the Rust functions return str.
+# The Rust calls get the same kind of module-level wrapper so both sides pay
+# one extra Python frame per round.
+def python_uuid1_str():
+    return str(python_uuid.uuid1())
+
+
+def python_uuid3_str(namespace, name):
+    return str(python_uuid.uuid3(namespace, name))
+
+
+def python_uuid4_str():
+    return str(python_uuid.uuid4())
+
+
+def python_uuid5_str(namespace, name):
+    return str(python_uuid.uuid5(namespace, name))
+
+
+def python_uuid7_str():
+    return str(PYTHON_UUID7())
+
+
+def rust_uuid1_str():
+    return rust_uuid.uuid1()
+
+
+def rust_uuid3_str(namespace, name):
+    return rust_uuid.uuid3(namespace, name)
+
+
+def rust_uuid4_str():
+    return rust_uuid.uuid4()
+
+
+def rust_uuid5_str(namespace, name):
+    return rust_uuid.uuid5(namespace, name)
+
+
+def rust_uuid7_str():
+    return rust_uuid.uuid7()
+
+
+@pytest.mark.benchmark(group="uuid1")
+def test_python_uuid1(benchmark):
+    benchmark(python_uuid1_str)
+
+
+@pytest.mark.benchmark(group="uuid1")
+def test_rust_uuid1(benchmark):
+    benchmark(rust_uuid1_str)
+
+
+@pytest.mark.benchmark(group="uuid3")
+def test_python_uuid3(benchmark):
+    benchmark(python_uuid3_str, python_uuid.NAMESPACE_DNS, TEST_NAME)
+
+
+@pytest.mark.benchmark(group="uuid3")
+def test_rust_uuid3(benchmark):
+    benchmark(rust_uuid3_str, rust_uuid.NAMESPACE_DNS, TEST_NAME)
+
+
+@pytest.mark.benchmark(group="uuid4")
+def test_python_uuid4(benchmark):
+    benchmark(python_uuid4_str)
+
+
+@pytest.mark.benchmark(group="uuid4")
+def test_rust_uuid4(benchmark):
+    benchmark(rust_uuid4_str)
+
+
+@pytest.mark.benchmark(group="uuid5")
+def test_python_uuid5(benchmark):
+    benchmark(python_uuid5_str, python_uuid.NAMESPACE_DNS, TEST_NAME)
+
+
+@pytest.mark.benchmark(group="uuid5")
+def test_rust_uuid5(benchmark):
+    benchmark(rust_uuid5_str, rust_uuid.NAMESPACE_DNS, TEST_NAME)
+
+
+@pytest.mark.benchmark(group="uuid7")
+@pytest.mark.skipif(
+    PYTHON_UUID7 is None,
+    reason="needs Python 3.14+ or uuid_utils",
+)
+def test_python_uuid7(benchmark):
+    benchmark(python_uuid7_str)
+
+
+@pytest.mark.benchmark(group="uuid7")
+def test_rust_uuid7(benchmark):
+    benchmark(rust_uuid7_str)
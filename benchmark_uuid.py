@@ -3,51 +3,236 @@
 Enhanced benchmark script with optimizations and analysis.
 """
 
+import argparse
+import concurrent.futures
+import functools
+import importlib.util
+import json
 import timeit
 import uuid as python_uuid
 import statistics
 import gc
+import os
+import platform
 import sys
+import time
+import tracemalloc
 
 try:
     import rust_uuid
     RUST_AVAILABLE = True
     print("✅ Rust UUID module loaded successfully")
+    # Namespace string shared by every uuid3/uuid5 call
+    NS_DNS = rust_uuid.NAMESPACE_DNS
 except ImportError as e:
     RUST_AVAILABLE = False
     print(f"❌ Failed to import rust_uuid: {e}")
     print("Make sure to build the module first with: maturin develop --release")
 
-def benchmark_function(func, name, iterations=100000, warmup=1000):
-    """Benchmark a function with warmup and return timing statistics."""
+# Default number of timed trials per benchmark (--trials)
+TRIALS = 5
+
+# Functions in the summary table, selectable with --filter
+SUMMARY_FUNCTIONS = ('uuid1', 'uuid3', 'uuid4', 'uuid5', 'uuid7')
+
+# CPU mask from before configure_benchmark_environment() pinned the process
+UNPINNED_AFFINITY = None
+
+def configure_benchmark_environment():
+    """Reduce measurement noise and return a description of the setup.
+    
+    Pins the process to the CPU given by ``BENCH_CPU`` (default 0) where the
+    platform supports it, and raises the thread switch interval since the
+    benchmarks are single-threaded.
+    """
+    global UNPINNED_AFFINITY
+    
+    try:
+        cpu = int(os.environ.get('BENCH_CPU', 0))
+        UNPINNED_AFFINITY = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {cpu})
+        affinity = f"pinned to CPU {cpu}"
+    except ValueError:
+        affinity = f"not pinned, BENCH_CPU={os.environ['BENCH_CPU']!r} is not a CPU number"
+    except (AttributeError, OSError):
+        affinity = "not pinned"
+    
+    sys.setswitchinterval(1.0)
+    
+    return {
+        'cpu': platform.processor() or platform.machine(),
+        'affinity': affinity,
+        'switch_interval': sys.getswitchinterval(),
+        'freq_ghz': cpu_freq_ghz(),
+    }
+
+@functools.lru_cache(maxsize=None)
+def cpu_freq_ghz():
+    """Return the current CPU frequency in GHz, or None if it is unknown."""
+    try:
+        import psutil
+        freq = psutil.cpu_freq()
+    except (ImportError, NotImplementedError, OSError):
+        return None
+    return freq.current / 1000 if freq and freq.current else None
+
+def format_per_op(seconds, iterations):
+    """Format a run time as ns/op, plus cycles/op when the CPU frequency is known."""
+    ns_per_op = seconds * 1e9 / iterations
+    text = f"{ns_per_op:,.1f} ns/op"
+    freq = cpu_freq_ghz()
+    if freq:
+        text += f", {ns_per_op * freq:,.0f} cycles/op"
+    return text
+
+def benchmark_function(func, name, iterations=100000, warmup=1000, stats=None, trials=TRIALS):
+    """Benchmark a zero-argument callable and return timing statistics."""
+    return benchmark_stmt("func()", {"func": func}, name, iterations, warmup, stats, trials)
+
+def benchmark_stmt(stmt, globals_dict, name, iterations=100000, warmup=1000, stats=None, trials=TRIALS):
+    """Benchmark a statement string with warmup and return timing statistics.
+    
+    The statement is compiled by ``timeit`` into its own loop, so each
+    measured iteration is just the statement itself with no wrapper call.
+    If ``stats`` is a dict it is filled with the mean and standard deviation
+    in seconds plus the iteration and trial counts.
+    """
     print(f"\n🔄 Benchmarking {name} ({iterations:,} iterations)...")
     
-    # Warmup
-    for _ in range(warmup):
-        func()
+    # Integer nanosecond clock, so short runs keep full resolution
+    timer = timeit.Timer(stmt, timer=time.perf_counter_ns, globals=globals_dict)
+    
+    # Warmup on the same Timer so the code object that gets specialized is
+    # the one being measured
+    timer.timeit(warmup)
     
     # Force garbage collection before benchmarking
     gc.collect()
     
     # Run multiple trials for more accurate results
-    trials = 5
     times = []
     
-    for trial in range(trials):
-        # Force garbage collection before each trial
-        gc.collect()
-        
-        time_taken = timeit.timeit(func, number=iterations)
-        times.append(time_taken)
-        print(f"  Trial {trial + 1}: {time_taken:.4f}s ({iterations/time_taken:,.0f} ops/sec)")
+    # Keep the collector off for the whole run, not just inside each timeit call
+    gc.disable()
+    try:
+        for trial in range(trials):
+            # Force garbage collection before each trial
+            gc.collect()
+            
+            time_taken = timer.timeit(iterations) / 1e9
+            times.append(time_taken)
+            print(f"  Trial {trial + 1}: {time_taken:.4f}s "
+                  f"({format_per_op(time_taken, iterations)}, {iterations/time_taken:,.0f} ops/sec)")
+    finally:
+        gc.enable()
     
     avg_time = statistics.mean(times)
     std_dev = statistics.stdev(times) if len(times) > 1 else 0
     
-    print(f"  📊 Average: {avg_time:.4f}s ± {std_dev:.4f}s ({iterations/avg_time:,.0f} ops/sec)")
+    print(f"  📊 Average: {avg_time:.4f}s ± {std_dev:.4f}s "
+          f"({format_per_op(avg_time, iterations)}, {iterations/avg_time:,.0f} ops/sec)")
+    if stats is not None:
+        stats.update(mean_s=avg_time, stddev_s=std_dev, iterations=iterations, trials=trials)
     return avg_time, iterations/avg_time
 
-def benchmark_batch_operations():
+def python_uuid7_baseline():
+    """Return a Python uuid7 implementation and its name, or (None, None).
+    
+    The stdlib has ``uuid.uuid7`` from Python 3.14; older versions fall back
+    to the third-party ``uuid_utils`` package when it is installed.
+    """
+    if hasattr(python_uuid, 'uuid7'):
+        return python_uuid.uuid7, "Python uuid7"
+    try:
+        import uuid_utils
+    except ImportError:
+        return None, None
+    return uuid_utils.uuid7, "uuid_utils uuid7"
+
+def split_uuid_batch(buf):
+    """Split a contiguous ``uuid4_batch`` buffer into a list of UUID strings."""
+    text = buf.decode('ascii')
+    return [text[i:i + 36] for i in range(0, len(text), 36)]
+
+class UuidPool:
+    """Pure-Python uuid4 baseline that batches its ``os.urandom`` reads.
+    
+    ``uuid.uuid4()`` reads 16 bytes from the OS per call; this reads
+    ``16 * n`` bytes at once and slices one UUID's worth per call.
+    """
+    
+    def __init__(self, n=1024):
+        self.n = n
+        self._refill()
+    
+    def _refill(self):
+        self.pool = os.urandom(16 * self.n)
+        self.offset = 0
+    
+    def uuid4(self):
+        if self.offset == len(self.pool):
+            self._refill()
+        raw = self.pool[self.offset:self.offset + 16]
+        self.offset += 16
+        # version=4 also sets the RFC 4122 variant bits
+        return str(python_uuid.UUID(bytes=raw, version=4))
+
+def verify_correctness():
+    """Check the Rust output against the Python uuid module."""
+    print("\n" + "="*50)
+    print("✅ CORRECTNESS CHECK")
+    print("="*50)
+    
+    test_name = "example.com"
+    ok = True
+    
+    # Name-based UUIDs are deterministic, so one comparison each is enough
+    for version, rust_func, rust_bytes_func, python_func in (
+        (3, rust_uuid.uuid3, rust_uuid.uuid3_bytes, python_uuid.uuid3),
+        (5, rust_uuid.uuid5, rust_uuid.uuid5_bytes, python_uuid.uuid5),
+    ):
+        expected = str(python_func(python_uuid.NAMESPACE_DNS, test_name))
+        for actual in (
+            rust_func(NS_DNS, test_name),
+            rust_bytes_func(NS_DNS.encode(), test_name.encode()),
+            rust_bytes_func(python_uuid.NAMESPACE_DNS.bytes, test_name.encode()),
+        ):
+            if actual != expected:
+                print(f"❌ uuid{version} mismatch: {actual} != {expected}")
+                ok = False
+    
+    # Every str-returning function goes through the hand-rolled formatter
+    for version, func in ((1, rust_uuid.uuid1), (4, rust_uuid.uuid4), (7, rust_uuid.uuid7)):
+        raw = func()
+        parsed = python_uuid.UUID(raw)
+        if parsed.version != version or parsed.variant != python_uuid.RFC_4122 or str(parsed) != raw:
+            print(f"❌ invalid uuid{version}: {raw}")
+            ok = False
+    
+    # FastUUID formats str() and .hex itself; check both against a known UUID
+    known = python_uuid.NAMESPACE_DNS
+    fast = rust_uuid.FastUUID(str(known))
+    if str(fast) != str(known) or fast.hex != known.hex:
+        print(f"❌ FastUUID mismatch: {fast} / {fast.hex} != {known} / {known.hex}")
+        ok = False
+    fast = rust_uuid.FastUUID()
+    parsed = python_uuid.UUID(str(fast))
+    if parsed.version != 4 or parsed.hex != fast.hex:
+        print(f"❌ invalid FastUUID: {fast} / {fast.hex}")
+        ok = False
+    
+    # Random UUIDs: validate one batch in a single FFI call
+    batch = split_uuid_batch(rust_uuid.uuid4_batch(10))
+    for raw, parsed in zip(batch, map(python_uuid.UUID, batch)):
+        if parsed.version != 4 or parsed.variant != python_uuid.RFC_4122 or str(parsed) != raw:
+            print(f"❌ invalid uuid4: {raw}")
+            ok = False
+    
+    if ok:
+        print("All Rust UUIDs match the Python uuid module")
+    return ok
+
+def benchmark_batch_operations(trials=TRIALS):
     """Benchmark batch operations if available."""
     if not RUST_AVAILABLE:
         return
@@ -69,64 +254,154 @@ def benchmark_batch_operations():
         if hasattr(rust_uuid, 'uuid4_batch'):
             def rust_batch():
                 return rust_uuid.uuid4_batch(batch_size)
+            
+            def rust_batch_list():
+                return split_uuid_batch(rust_uuid.uuid4_batch(batch_size))
         else:
             def rust_batch():
                 return [rust_uuid.uuid4() for _ in range(batch_size)]
+            
+            rust_batch_list = None
         
-        py_time, py_ops = benchmark_function(python_batch, f"Python batch ({batch_size:,})", 10, 5)
-        rust_time, rust_ops = benchmark_function(rust_batch, f"Rust batch ({batch_size:,})", 10, 5)
+        py_time, py_ops = benchmark_function(python_batch, f"Python batch ({batch_size:,})", 10, 5, trials=trials)
+        rust_time, rust_ops = benchmark_function(rust_batch, f"Rust batch ({batch_size:,})", 10, 5, trials=trials)
         
         speedup = rust_ops / py_ops
         print(f"  🎯 Batch speedup: {speedup:.2f}x")
+        
+        if rust_batch_list is not None:
+            list_time, list_ops = benchmark_function(
+                rust_batch_list, f"Rust batch split to list ({batch_size:,})", 10, 5, trials=trials
+            )
+            print(f"  🎯 Batch speedup (list of str): {list_ops / py_ops:.2f}x")
+        
+        # Raw 16-byte UUIDs in a NumPy array (needs numpy at runtime)
+        if hasattr(rust_uuid, 'uuid4_batch_np') and importlib.util.find_spec('numpy'):
+            np_time, np_ops = benchmark_stmt(
+                "f(n)", {"f": rust_uuid.uuid4_batch_np, "n": batch_size},
+                f"Rust NumPy batch ({batch_size:,})", 10, 5, trials=trials
+            )
+            print(f"  🎯 Batch speedup (NumPy array): {np_ops / py_ops:.2f}x")
+            print(f"  Throughput: {np_ops * batch_size * 16 / 1e6:,.1f} MB/s as uint8[16] vs "
+                  f"{rust_ops * batch_size * 36 / 1e6:,.1f} MB/s as ASCII")
+
+def benchmark_threaded(trials=TRIALS):
+    """Benchmark batch generation throughput across thread counts."""
+    if not RUST_AVAILABLE:
+        return
+    
+    print("\n" + "="*50)
+    print("🧵 THREADED THROUGHPUT")
+    print("="*50)
+    
+    per_thread = 10_000
+    thread_counts = [1, 2, 4, 8]
+    
+    def python_batch(_):
+        return [str(python_uuid.uuid4()) for _ in range(per_thread)]
+    
+    # Same list[str] result as the Python side; the split holds the GIL
+    def rust_batch(_):
+        return split_uuid_batch(rust_uuid.uuid4_batch(per_thread))
+    
+    # Raw buffer only: generation runs with the GIL released, so once the
+    # process may use several CPUs the threads can overlap
+    def rust_raw_batch(_):
+        return rust_uuid.uuid4_batch(per_thread)
+    
+    # The long interval set for single-threaded runs would starve the Python threads
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(0.005)
+    
+    # Worker threads inherit the single-CPU pin, which would serialize them
+    try:
+        pinned_affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, UNPINNED_AFFINITY or set(range(os.cpu_count() or 1)))
+    except (AttributeError, OSError):
+        pinned_affinity = None
+    
+    try:
+        rows = []
+        for threads in thread_counts:
+            row = {}
+            with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+                for label, func in (('python', python_batch), ('rust', rust_batch), ('rust_raw', rust_raw_batch)):
+                    # Warmup: spawns the pool's worker threads and warms the call path
+                    list(executor.map(func, range(threads)))
+                    
+                    best = None
+                    for _ in range(trials):
+                        start = time.perf_counter_ns()
+                        list(executor.map(func, range(threads)))
+                        elapsed = time.perf_counter_ns() - start
+                        best = elapsed if best is None else min(best, elapsed)
+                    row[label] = threads * per_thread * 1e9 / best
+            rows.append((threads, row))
+    finally:
+        sys.setswitchinterval(switch_interval)
+        if pinned_affinity is not None:
+            os.sched_setaffinity(0, pinned_affinity)
+    
+    print(f"{'Threads':<8} {'Python list[str]':<18} {'Rust list[str]':<18} "
+          f"{'Rust raw bytes':<18} {'Raw scaling':<12}")
+    print("-" * 78)
+    raw_single = rows[0][1]['rust_raw']
+    for threads, row in rows:
+        print(f"{threads:<8} {row['python']:>16,.0f}   {row['rust']:>16,.0f}   "
+              f"{row['rust_raw']:>16,.0f}   {row['rust_raw'] / raw_single:>10.2f}x")
+    print("(UUIDs/sec; raw bytes is the uuid4_batch buffer without splitting it into str)")
 
 def profile_memory_usage():
     """Profile memory usage of UUID generation."""
-    try:
-        import psutil
-        import os
-        
-        print("\n" + "="*50)
-        print("🧠 MEMORY USAGE ANALYSIS")
-        print("="*50)
-        
-        process = psutil.Process(os.getpid())
-        
-        # Baseline memory
-        baseline_memory = process.memory_info().rss / 1024 / 1024  # MB
-        
-        # Generate many UUIDs and measure memory
-        n_uuids = 100000
-        
-        # Python UUID memory usage
-        gc.collect()
-        start_memory = process.memory_info().rss / 1024 / 1024
-        python_uuids = [str(python_uuid.uuid4()) for _ in range(n_uuids)]
-        end_memory = process.memory_info().rss / 1024 / 1024
-        python_memory_usage = end_memory - start_memory
+    print("\n" + "="*50)
+    print("🧠 MEMORY USAGE ANALYSIS")
+    print("="*50)
+    
+    # Generate many UUIDs and measure memory
+    n_uuids = 100000
+    
+    # Preallocated once and reused, so list growth never shows up in the deltas
+    uuids = [None] * n_uuids
+    
+    # tracemalloc counts the bytes held by Python allocations, unlike RSS
+    # which is page-granular and includes allocator slack
+    gc.collect()
+    tracemalloc.start()
+    
+    # Python UUID memory usage
+    start_memory = tracemalloc.get_traced_memory()[0]
+    for i in range(n_uuids):
+        uuids[i] = str(python_uuid.uuid4())
+    end_memory = tracemalloc.get_traced_memory()[0]
+    python_memory_usage = end_memory - start_memory
+    
+    for i in range(n_uuids):
+        uuids[i] = None
+    gc.collect()
+    
+    if RUST_AVAILABLE:
+        # Rust UUID memory usage
+        start_memory = tracemalloc.get_traced_memory()[0]
+        for i in range(n_uuids):
+            uuids[i] = rust_uuid.uuid4()
+        end_memory = tracemalloc.get_traced_memory()[0]
+        rust_memory_usage = end_memory - start_memory
         
-        del python_uuids
+        for i in range(n_uuids):
+            uuids[i] = None
         gc.collect()
-        
-        if RUST_AVAILABLE:
-            # Rust UUID memory usage
-            start_memory = process.memory_info().rss / 1024 / 1024
-            rust_uuids = [rust_uuid.uuid4() for _ in range(n_uuids)]
-            end_memory = process.memory_info().rss / 1024 / 1024
-            rust_memory_usage = end_memory - start_memory
-            
-            del rust_uuids
-            gc.collect()
-            
-            print(f"Python memory usage: {python_memory_usage:.2f} MB")
-            print(f"Rust memory usage: {rust_memory_usage:.2f} MB")
-            print(f"Memory efficiency: {python_memory_usage/rust_memory_usage:.2f}x")
-        else:
-            print(f"Python memory usage: {python_memory_usage:.2f} MB")
-            
-    except ImportError:
-        print("psutil not available for memory profiling")
+    
+    tracemalloc.stop()
+    del uuids
+    
+    print(f"Python memory usage: {python_memory_usage / 1024 / 1024:.2f} MB "
+          f"({python_memory_usage / n_uuids:.1f} B/UUID)")
+    if RUST_AVAILABLE:
+        print(f"Rust memory usage: {rust_memory_usage / 1024 / 1024:.2f} MB "
+              f"({rust_memory_usage / n_uuids:.1f} B/UUID)")
+        print(f"Memory efficiency: {python_memory_usage/rust_memory_usage:.2f}x")
 
-def analyze_performance_bottlenecks():
+def analyze_performance_bottlenecks(iterations=100000, trials=TRIALS):
     """Analyze where the performance bottlenecks are."""
     if not RUST_AVAILABLE:
         return
@@ -136,7 +411,6 @@ def analyze_performance_bottlenecks():
     print("="*50)
     
     # Test different aspects of UUID generation
-    iterations = 100000
     
     # Test string conversion overhead
     print("\n🔸 String Conversion Overhead")
@@ -147,11 +421,57 @@ def analyze_performance_bottlenecks():
     def python_uuid_no_str():
         return str(python_uuid.uuid4())
     
-    rust_time, rust_ops = benchmark_function(rust_uuid_no_str, "Rust UUID4 (with string)", iterations)
-    py_time, py_ops = benchmark_function(python_uuid_no_str, "Python UUID4 (with string)", iterations)
+    rust_time, rust_ops = benchmark_function(rust_uuid_no_str, "Rust UUID4 (with string)", iterations, trials=trials)
+    py_time, py_ops = benchmark_function(python_uuid_no_str, "Python UUID4 (with string)", iterations, trials=trials)
     
     print(f"  Raw performance difference: {rust_ops/py_ops:.2f}x")
     
+    # Python's uuid4() alone returns a UUID object; the str() step is extra work
+    py_obj_time, py_obj_ops = benchmark_function(python_uuid.uuid4, "Python UUID4 (object only)", iterations, trials=trials)
+    print(f"  Python str() cost: {1e9 / py_ops - 1e9 / py_obj_ops:+.1f} ns/op")
+    print(f"  Rust str vs Python object: {rust_ops/py_obj_ops:.2f}x")
+    
+    # Same UUID without the hex formatting step, to isolate its cost
+    bytes_time, bytes_ops = benchmark_function(rust_uuid.uuid4_bytes, "Rust UUID4 (bytes)", iterations, trials=trials)
+    int_time, int_ops = benchmark_function(rust_uuid.uuid4_int, "Rust UUID4 (int)", iterations, trials=trials)
+    obj_time, obj_ops = benchmark_stmt(
+        "UUID(int=f())", {"UUID": python_uuid.UUID, "f": rust_uuid.uuid4_int},
+        "Rust UUID4 (int -> uuid.UUID)", iterations, trials=trials
+    )
+    
+    # Formatting alone: stringify an existing UUID, no RNG involved
+    fmt_time, fmt_ops = benchmark_stmt(
+        "f(u)", {"f": str, "u": rust_uuid.FastUUID()}, "Rust FastUUID str()", iterations, trials=trials
+    )
+    py_fmt_time, py_fmt_ops = benchmark_stmt(
+        "f(u)", {"f": str, "u": python_uuid.uuid4()}, "Python UUID str()", iterations, trials=trials
+    )
+    print(f"  Formatter speedup: {fmt_ops/py_fmt_ops:.2f}x")
+    
+    str_ns = 1e9 / rust_ops
+    print(f"  Formatting cost vs bytes: {str_ns - 1e9 / bytes_ops:+.1f} ns/op")
+    print(f"  Formatting cost vs int: {str_ns - 1e9 / int_ops:+.1f} ns/op")
+    print(f"  uuid.UUID(int=...) vs str: {1e9 / obj_ops - str_ns:+.1f} ns/op")
+    
+    # Name-based UUIDs from bytes arguments skip PyO3's str -> &str extraction
+    print("\n🔸 Argument Conversion Overhead")
+    test_name = "example.com"
+    u3_str_time, u3_str_ops = benchmark_stmt(
+        "f(ns, nm)", {"f": rust_uuid.uuid3, "ns": NS_DNS, "nm": test_name},
+        "Rust uuid3 (str args)", iterations, trials=trials
+    )
+    u3_bytes_time, u3_bytes_ops = benchmark_stmt(
+        "f(ns, nm)", {"f": rust_uuid.uuid3_bytes, "ns": NS_DNS.encode(), "nm": test_name.encode()},
+        "Rust uuid3_bytes (bytes args)", iterations, trials=trials
+    )
+    print(f"  str decode cost: {1e9 / u3_str_ops - 1e9 / u3_bytes_ops:+.1f} ns/op")
+    
+    # Python with the same RNG batching trick the Rust batch path uses
+    print("\n🔸 Pooled Python Baseline")
+    pooled_time, pooled_ops = benchmark_function(UuidPool().uuid4, "Python UUID4 (pooled urandom)", iterations, trials=trials)
+    print(f"  Pooling speedup for Python: {pooled_ops/py_ops:.2f}x")
+    print(f"  Rust vs pooled Python: {rust_ops/pooled_ops:.2f}x")
+    
     # Test PyO3 call overhead
     print("\n🔸 Function Call Overhead")
     def rust_multiple_calls():
@@ -168,12 +488,148 @@ def analyze_performance_bottlenecks():
         python_uuid.uuid4()
         python_uuid.uuid4()
     
-    rust_time, rust_ops = benchmark_function(rust_multiple_calls, "Rust 5x calls", iterations//5)
-    py_time, py_ops = benchmark_function(python_multiple_calls, "Python 5x calls", iterations//5)
+    rust_time, rust_ops = benchmark_function(rust_multiple_calls, "Rust 5x calls", max(1, iterations//5), trials=trials)
+    py_time, py_ops = benchmark_function(python_multiple_calls, "Python 5x calls", max(1, iterations//5), trials=trials)
     
     print(f"  Call overhead impact: {rust_ops/py_ops:.2f}x")
+    
+    # Same generator looped inside Rust: one FFI call for all iterations
+    print("\n🔸 FFI Tax")
+    rust_uuid.bench_uuid4(iterations // 10)
+    no_ffi_times = []
+    for _ in range(trials):
+        start = time.perf_counter_ns()
+        rust_uuid.bench_uuid4(iterations)
+        no_ffi_times.append(time.perf_counter_ns() - start)
+    
+    # A Rust function that does nothing and returns None: the call alone
+    noop_time, noop_ops = benchmark_function(rust_uuid.bench_noop, "Rust no-op call", iterations, trials=trials)
+    
+    no_ffi_ns = min(no_ffi_times) / iterations
+    call_ns = 1e9 / noop_ops
+    bytes_ns = 1e9 / bytes_ops
+    print(f"  Rust uuid4 in-Rust loop (no FFI): {no_ffi_ns:.1f} ns/op")
+    print(f"  Rust no-op call (FFI tax): {call_ns:.1f} ns/op")
+    print(f"  Rust uuid4_bytes per call: {bytes_ns:.1f} ns/op "
+          f"(generation + call + PyBytes alloc)")
+    print(f"  PyBytes alloc and return: {bytes_ns - no_ffi_ns - call_ns:+.1f} ns/op")
+
+def print_summary(results):
+    """Print the per-function comparison table and return the average speedup."""
+    print("\n" + "=" * 50)
+    print("📈 PERFORMANCE SUMMARY")
+    print("=" * 50)
+    print(f"{'Function':<10} {'Python (ops/s)':<15} {'Rust (ops/s)':<15} "
+          f"{'Python (ns/op)':<15} {'Rust (ns/op)':<15} {'Speedup':<10}")
+    print("-" * 87)
+    print("(Python timings include str() so both sides return a str)")
+    
+    for func_name, data in results.items():
+        if data['speedup'] is None:
+            # Rust-only row: no Python baseline to compare against
+            print(f"{func_name:<10} {'n/a':>12}   {data['rust']:>12,.0f}   "
+                  f"{'n/a':>12}   {1e9 / data['rust']:>12,.1f}   {'n/a':<10}")
+            continue
+        
+        speedup_str = f"{data['speedup']:.1f}x"
+        if data['speedup'] >= 2.0:
+            speedup_str = f"🚀 {speedup_str}"
+        elif data['speedup'] >= 1.2:
+            speedup_str = f"⚡ {speedup_str}"
+        elif data['speedup'] >= 0.8:
+            speedup_str = f"📊 {speedup_str}"
+        else:
+            speedup_str = f"🐌 {speedup_str}"
+            
+        print(f"{func_name:<10} {data['python']:>12,.0f}   {data['rust']:>12,.0f}   "
+              f"{1e9 / data['python']:>12,.1f}   {1e9 / data['rust']:>12,.1f}   {speedup_str:<10}")
+    
+    # Overall average speedup, over the rows that have a Python baseline
+    speedups = [data['speedup'] for data in results.values() if data['speedup'] is not None]
+    if not speedups:
+        print("\n🎯 No Python baselines to compute a speedup against")
+        return None
+    avg_speedup = statistics.mean(speedups)
+    print(f"\n🎯 Overall average speedup: {avg_speedup:.1f}x")
+    return avg_speedup
+
+def summarize_benchmark_json(path):
+    """Print the summary table from a ``pytest bench_uuid.py --benchmark-json`` file."""
+    with open(path) as f:
+        report = json.load(f)
+    
+    # Benchmarks are grouped per function and named test_{python,rust}_<func>
+    ops = {}
+    for bench in report['benchmarks']:
+        impl = 'python' if bench['name'].startswith('test_python_') else 'rust'
+        ops.setdefault(bench['group'], {})[impl] = bench['stats']['ops']
+    
+    results = {}
+    for func_name, data in ops.items():
+        if 'python' in data and 'rust' in data:
+            results[func_name] = {**data, 'speedup': data['rust'] / data['python']}
+    
+    if not results:
+        print(f"No paired Python/Rust benchmarks found in {path}")
+        return
+    print_summary(results)
+
+def int_at_least(minimum):
+    """Return an argparse type that accepts integers no smaller than ``minimum``."""
+    def parse(text):
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected an integer, got {text!r}")
+        if value < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {value}")
+        return value
+    return parse
+
+def comparison_entry(python_stats, rust_stats):
+    """Build a summary row from the ``stats`` recorded by two benchmark runs.
+    
+    ``python_stats`` may be None when there is no Python baseline; the
+    Python and speedup fields are then None.
+    """
+    rust_ops = rust_stats['iterations'] / rust_stats['mean_s']
+    if python_stats:
+        python_ops = python_stats['iterations'] / python_stats['mean_s']
+        python_stddev_ns = python_stats['stddev_s'] * 1e9 / python_stats['iterations']
+    else:
+        python_ops = python_stddev_ns = None
+    return {
+        'python': python_ops,
+        'rust': rust_ops,
+        'speedup': rust_ops / python_ops if python_ops else None,
+        'python_stddev_ns': python_stddev_ns,
+        'rust_stddev_ns': rust_stats['stddev_s'] * 1e9 / rust_stats['iterations'],
+        'iterations': rust_stats['iterations'],
+        'trials': rust_stats['trials'],
+    }
+
+def write_results_json(path, results, setup):
+    """Write the summary rows plus run metadata as JSON for regression tracking."""
+    report = {
+        func_name: {
+            **data,
+            'python_ns_per_op': 1e9 / data['python'] if data['python'] else None,
+            'rust_ns_per_op': 1e9 / data['rust'],
+        }
+        for func_name, data in results.items()
+    }
+    report['meta'] = {
+        'python_version': sys.version,
+        'rust_uuid_version': getattr(rust_uuid, '__version__', None),
+        'cpu': setup['cpu'],
+        'freq_ghz': setup['freq_ghz'],
+        'affinity': setup['affinity'],
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
 
-def main():
+def main(iterations=100000, functions=None, json_path=None, trials=TRIALS):
+    """Run the benchmarks and return the process exit status."""
     print("🚀 Enhanced UUID Performance Benchmark")
     print("=" * 50)
     print(f"Python version: {sys.version}")
@@ -182,84 +638,106 @@ def main():
         print("Rust module not available. Only benchmarking Python uuid module.")
         return
     
-    iterations = 100000
+    setup = configure_benchmark_environment()
+    freq = f", {setup['freq_ghz']:.2f} GHz" if setup['freq_ghz'] else ""
+    print(f"CPU: {setup['cpu']}{freq} ({setup['affinity']})")
+    print(f"Switch interval: {setup['switch_interval']}s, GC disabled during trials")
+    
+    if not verify_correctness():
+        print("Rust output is incorrect, skipping benchmarks.")
+        return 1
+    
     results = {}
     
+    def selected(func_name):
+        return functions is None or func_name in functions
+    
     # Test data for uuid3 and uuid5
     test_namespace = python_uuid.NAMESPACE_DNS
     test_name = "example.com"
     
     # Benchmark UUID1 (time-based)
-    print("\n🔸 UUID1 (Time-based)")
-    py_time, py_ops = benchmark_function(python_uuid.uuid1, "Python uuid1", iterations)
-    rust_time, rust_ops = benchmark_function(rust_uuid.uuid1, "Rust uuid1", iterations)
-    results['uuid1'] = {'python': py_ops, 'rust': rust_ops, 'speedup': rust_ops / py_ops}
+    if selected('uuid1'):
+        print("\n🔸 UUID1 (Time-based)")
+        py_stats, rust_stats = {}, {}
+        # Python baselines are wrapped in str() since the Rust functions return str
+        benchmark_stmt("str(f())", {"f": python_uuid.uuid1}, "Python uuid1", iterations, stats=py_stats, trials=trials)
+        benchmark_function(rust_uuid.uuid1, "Rust uuid1", iterations, stats=rust_stats, trials=trials)
+        results['uuid1'] = comparison_entry(py_stats, rust_stats)
     
     # Benchmark UUID3 (MD5-based)
-    print("\n🔸 UUID3 (MD5-based)")
-    py_time, py_ops = benchmark_function(
-        lambda: python_uuid.uuid3(test_namespace, test_name), 
-        "Python uuid3", iterations
-    )
-    rust_time, rust_ops = benchmark_function(
-        lambda: rust_uuid.uuid3(str(test_namespace), test_name), 
-        "Rust uuid3", iterations
-    )
-    results['uuid3'] = {'python': py_ops, 'rust': rust_ops, 'speedup': rust_ops / py_ops}
+    if selected('uuid3'):
+        print("\n🔸 UUID3 (MD5-based)")
+        py_stats, rust_stats = {}, {}
+        benchmark_stmt(
+            "str(f(ns, nm))", {"f": python_uuid.uuid3, "ns": test_namespace, "nm": test_name},
+            "Python uuid3", iterations, stats=py_stats, trials=trials
+        )
+        benchmark_stmt(
+            "f(ns, nm)", {"f": rust_uuid.uuid3, "ns": NS_DNS, "nm": test_name},
+            "Rust uuid3", iterations, stats=rust_stats, trials=trials
+        )
+        results['uuid3'] = comparison_entry(py_stats, rust_stats)
     
     # Benchmark UUID4 (random)
-    print("\n🔸 UUID4 (Random)")
-    py_time, py_ops = benchmark_function(python_uuid.uuid4, "Python uuid4", iterations)
-    rust_time, rust_ops = benchmark_function(rust_uuid.uuid4, "Rust uuid4", iterations)
-    results['uuid4'] = {'python': py_ops, 'rust': rust_ops, 'speedup': rust_ops / py_ops}
+    if selected('uuid4'):
+        print("\n🔸 UUID4 (Random)")
+        py_stats, rust_stats = {}, {}
+        benchmark_stmt("str(f())", {"f": python_uuid.uuid4}, "Python uuid4", iterations, stats=py_stats, trials=trials)
+        benchmark_function(rust_uuid.uuid4, "Rust uuid4", iterations, stats=rust_stats, trials=trials)
+        results['uuid4'] = comparison_entry(py_stats, rust_stats)
     
     # Benchmark UUID5 (SHA1-based)
-    print("\n🔸 UUID5 (SHA1-based)")
-    py_time, py_ops = benchmark_function(
-        lambda: python_uuid.uuid5(test_namespace, test_name), 
-        "Python uuid5", iterations
-    )
-    rust_time, rust_ops = benchmark_function(
-        lambda: rust_uuid.uuid5(str(test_namespace), test_name), 
-        "Rust uuid5", iterations
-    )
-    results['uuid5'] = {'python': py_ops, 'rust': rust_ops, 'speedup': rust_ops / py_ops}
-    
-    # Print summary
-    print("\n" + "=" * 50)
-    print("📈 PERFORMANCE SUMMARY")
-    print("=" * 50)
-    print(f"{'Function':<10} {'Python (ops/s)':<15} {'Rust (ops/s)':<15} {'Speedup':<10}")
-    print("-" * 55)
+    if selected('uuid5'):
+        print("\n🔸 UUID5 (SHA1-based)")
+        py_stats, rust_stats = {}, {}
+        benchmark_stmt(
+            "str(f(ns, nm))", {"f": python_uuid.uuid5, "ns": test_namespace, "nm": test_name},
+            "Python uuid5", iterations, stats=py_stats, trials=trials
+        )
+        benchmark_stmt(
+            "f(ns, nm)", {"f": rust_uuid.uuid5, "ns": NS_DNS, "nm": test_name},
+            "Rust uuid5", iterations, stats=rust_stats, trials=trials
+        )
+        results['uuid5'] = comparison_entry(py_stats, rust_stats)
     
-    for func_name, data in results.items():
-        speedup_str = f"{data['speedup']:.1f}x"
-        if data['speedup'] >= 2.0:
-            speedup_str = f"🚀 {speedup_str}"
-        elif data['speedup'] >= 1.2:
-            speedup_str = f"⚡ {speedup_str}"
-        elif data['speedup'] >= 0.8:
-            speedup_str = f"📊 {speedup_str}"
+    # Benchmark UUID7 (time-ordered)
+    if selected('uuid7'):
+        print("\n🔸 UUID7 (Time-ordered)")
+        py_stats, rust_stats = {}, {}
+        benchmark_function(rust_uuid.uuid7, "Rust uuid7", iterations, stats=rust_stats, trials=trials)
+        uuid7_func, uuid7_name = python_uuid7_baseline()
+        if uuid7_func is not None:
+            benchmark_stmt("str(f())", {"f": uuid7_func}, uuid7_name, iterations, stats=py_stats, trials=trials)
         else:
-            speedup_str = f"🐌 {speedup_str}"
-            
-        print(f"{func_name:<10} {data['python']:>12,.0f}   {data['rust']:>12,.0f}   {speedup_str:<10}")
+            print("  No Python uuid7 available (needs Python 3.14+ or uuid_utils), skipping comparison")
+        results['uuid7'] = comparison_entry(py_stats, rust_stats)
     
-    # Overall average speedup
-    avg_speedup = statistics.mean([data['speedup'] for data in results.values()])
-    print(f"\n🎯 Overall average speedup: {avg_speedup:.1f}x")
+    if not results:
+        print("\nNo benchmarks selected.")
+        return
     
-    # Additional analysis
-    analyze_performance_bottlenecks()
-    benchmark_batch_operations()
-    profile_memory_usage()
+    if json_path:
+        write_results_json(json_path, results, setup)
+        print(f"\n📝 Wrote results to {json_path}")
+    
+    avg_speedup = print_summary(results)
+    
+    # Additional analysis, skipped when only some functions were requested
+    if functions is None:
+        analyze_performance_bottlenecks(iterations, trials)
+        benchmark_batch_operations(trials)
+        benchmark_threaded(trials)
+        profile_memory_usage()
     
     # Recommendations
     print("\n" + "=" * 50)
     print("💡 RECOMMENDATIONS")
     print("=" * 50)
     
-    if avg_speedup < 1.0:
+    if avg_speedup is None:
+        print("📊 No Python baselines were benchmarked, so there is nothing to compare.")
+    elif avg_speedup < 1.0:
         print("🔍 The Rust implementation is slower than Python. This is likely due to:")
         print("   1. PyO3 function call overhead")
         print("   2. String conversion overhead")
@@ -274,4 +752,30 @@ def main():
         print("   Consider using it for production workloads.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__)
+    # The 5x-calls benchmark runs iterations // 5, so fewer than 5 would be zero
+    parser.add_argument('--iterations', type=int_at_least(5), default=100000,
+                        help="iterations per trial for the per-function benchmarks, at least 5 (default: 100000)")
+    parser.add_argument('--trials', type=int_at_least(1), default=TRIALS,
+                        help=f"timed trials per benchmark (default: {TRIALS})")
+    parser.add_argument('--json', metavar='PATH',
+                        help="also write the summary results and run metadata to PATH as JSON")
+    parser.add_argument('--filter', metavar='FUNCS',
+                        help="comma-separated functions to benchmark, e.g. uuid4,uuid7; "
+                             "skips the extra analysis sections")
+    parser.add_argument('--summarize', metavar='JSON',
+                        help="print the summary table from a pytest-benchmark JSON file instead of benchmarking")
+    args = parser.parse_args()
+    
+    functions = None
+    if args.filter:
+        functions = set(args.filter.split(','))
+        unknown = functions - set(SUMMARY_FUNCTIONS)
+        if unknown:
+            parser.error(f"unknown --filter function(s): {', '.join(sorted(unknown))} "
+                         f"(choose from {', '.join(SUMMARY_FUNCTIONS)})")
+    
+    if args.summarize:
+        summarize_benchmark_json(args.summarize)
+    else:
+        sys.exit(main(args.iterations, functions, args.json, args.trials))
\ No newline at end of file
@@ -1,4 +1,6 @@
+use numpy::{PyArray1, PyArray2};
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyString};
 use uuid::Uuid;
 use std::sync::OnceLock;
 
@@ -8,12 +10,27 @@ const NAMESPACE_URL_UUID: Uuid = uuid::uuid!("6ba7b811-9dad-11d1-80b4-00c04fd430
 const NAMESPACE_OID_UUID: Uuid = uuid::uuid!("6ba7b812-9dad-11d1-80b4-00c04fd430c8");
 const NAMESPACE_X500_UUID: Uuid = uuid::uuid!("6ba7b814-9dad-11d1-80b4-00c04fd430c8");
 
+// Hex digit pairs for every byte value, used by the hand-rolled formatter
+const HEX_PAIRS: [[u8; 2]; 256] = {
+    const DIGITS: &[u8; 16] = b"0123456789abcdef";
+    let mut table = [[0u8; 2]; 256];
+    let mut i = 0;
+    while i < 256 {
+        table[i] = [DIGITS[i >> 4], DIGITS[i & 0xf]];
+        i += 1;
+    }
+    table
+};
+
+// Output offset of each byte's hex pair in the hyphenated form
+const HYPHENATED_OFFSETS: [usize; 16] = [0, 2, 4, 6, 9, 11, 14, 16, 19, 21, 24, 26, 28, 30, 32, 34];
+
 // Static node ID for uuid1 - initialize once
 static NODE_ID: OnceLock<[u8; 6]> = OnceLock::new();
 
 /// Generate a version 1 UUID (time-based)
 #[pyfunction]
-fn uuid1() -> String {
+fn uuid1<'py>(py: Python<'py>) -> &'py PyString {
     // Initialize node ID once (simulate MAC address)
     let node_id = NODE_ID.get_or_init(|| {
         use std::hash::{Hash, Hasher};
@@ -31,45 +48,176 @@ fn uuid1() -> String {
     });
     
     let uuid = Uuid::now_v1(node_id);
-    format_uuid_fast(&uuid)
+    format_uuid_fast(py, &uuid)
 }
 
 /// Generate a version 3 UUID (MD5 hash-based)
 #[pyfunction]
-fn uuid3(namespace: &str, name: &str) -> PyResult<String> {
+fn uuid3<'py>(py: Python<'py>, namespace: &str, name: &str) -> PyResult<&'py PyString> {
     let namespace_uuid = parse_namespace(namespace)?;
     let uuid = Uuid::new_v3(&namespace_uuid, name.as_bytes());
-    Ok(format_uuid_fast(&uuid))
+    Ok(format_uuid_fast(py, &uuid))
+}
+
+/// Generate a version 3 UUID from `bytes` arguments, skipping str decoding
+///
+/// The namespace may be the 16 raw bytes or the ASCII form accepted by `uuid3`.
+#[pyfunction]
+fn uuid3_bytes<'py>(py: Python<'py>, namespace: &[u8], name: &[u8]) -> PyResult<&'py PyString> {
+    let namespace_uuid = parse_namespace_bytes(namespace)?;
+    let uuid = Uuid::new_v3(&namespace_uuid, name);
+    Ok(format_uuid_fast(py, &uuid))
 }
 
 /// Generate a version 4 UUID (random)
 #[pyfunction]
-fn uuid4() -> String {
+fn uuid4<'py>(py: Python<'py>) -> &'py PyString {
     let uuid = Uuid::new_v4();
-    format_uuid_fast(&uuid)
+    format_uuid_fast(py, &uuid)
+}
+
+/// Generate a version 4 UUID as 16 raw bytes (no string formatting)
+#[pyfunction]
+fn uuid4_bytes<'py>(py: Python<'py>) -> &'py PyBytes {
+    PyBytes::new(py, Uuid::new_v4().as_bytes())
+}
+
+/// Generate a version 4 UUID as a 128-bit integer, e.g. for `uuid.UUID(int=...)`
+#[pyfunction]
+fn uuid4_int() -> u128 {
+    Uuid::new_v4().as_u128()
 }
 
 /// Generate a version 5 UUID (SHA1 hash-based)
 #[pyfunction]
-fn uuid5(namespace: &str, name: &str) -> PyResult<String> {
+fn uuid5<'py>(py: Python<'py>, namespace: &str, name: &str) -> PyResult<&'py PyString> {
     let namespace_uuid = parse_namespace(namespace)?;
     let uuid = Uuid::new_v5(&namespace_uuid, name.as_bytes());
-    Ok(format_uuid_fast(&uuid))
+    Ok(format_uuid_fast(py, &uuid))
+}
+
+/// Generate a version 5 UUID from `bytes` arguments, skipping str decoding
+///
+/// The namespace may be the 16 raw bytes or the ASCII form accepted by `uuid5`.
+#[pyfunction]
+fn uuid5_bytes<'py>(py: Python<'py>, namespace: &[u8], name: &[u8]) -> PyResult<&'py PyString> {
+    let namespace_uuid = parse_namespace_bytes(namespace)?;
+    let uuid = Uuid::new_v5(&namespace_uuid, name);
+    Ok(format_uuid_fast(py, &uuid))
+}
+
+/// Generate a version 7 UUID (Unix timestamp plus random, time-ordered)
+#[pyfunction]
+fn uuid7<'py>(py: Python<'py>) -> &'py PyString {
+    let uuid = Uuid::now_v7();
+    format_uuid_fast(py, &uuid)
 }
 
 /// Generate multiple version 4 UUIDs at once (batch operation)
+///
+/// Returns a single ASCII `bytes` object of `count * 36` bytes holding the
+/// hyphenated UUIDs back to back, so the whole batch costs one FFI call.
+#[pyfunction]
+fn uuid4_batch(py: Python, count: usize) -> PyResult<PyObject> {
+    let mut random = alloc_batch_buffer(count, 16)?;
+    let mut out = alloc_batch_buffer(count, 36)?;
+    py.allow_threads(|| -> Result<(), getrandom::Error> {
+        fill_uuid4_bytes(&mut random)?;
+        for (block, dst) in random.chunks_exact(16).zip(out.chunks_exact_mut(36)) {
+            encode_hyphenated(block.try_into().unwrap(), dst.try_into().unwrap());
+        }
+        Ok(())
+    })
+    .map_err(random_error)?;
+    Ok(PyBytes::new(py, &out).into())
+}
+
+/// Generate multiple version 4 UUIDs as a `(count, 16)` uint8 NumPy array
+///
+/// The random bytes are written straight into the array's buffer, so there
+/// is no per-UUID Python object at all.
+#[pyfunction]
+fn uuid4_batch_np<'py>(py: Python<'py>, count: usize) -> PyResult<&'py PyArray2<u8>> {
+    let mut random = alloc_batch_buffer(count, 16)?;
+    py.allow_threads(|| fill_uuid4_bytes(&mut random)).map_err(random_error)?;
+    // The array takes ownership of the buffer, so nothing is copied
+    PyArray1::from_vec(py, random).reshape([count, 16])
+}
+
+/// Allocate a zeroed `count * width` byte buffer for a batch
+///
+/// Raises instead of aborting the process when the size overflows or the
+/// allocation fails, since release builds use `panic = "abort"`.
+fn alloc_batch_buffer(count: usize, width: usize) -> PyResult<Vec<u8>> {
+    let len = count
+        .checked_mul(width)
+        .filter(|&len| len <= isize::MAX as usize)
+        .ok_or_else(|| pyo3::exceptions::PyOverflowError::new_err("batch size too large"))?;
+    let mut buf = Vec::new();
+    buf.try_reserve_exact(len)
+        .map_err(|_| pyo3::exceptions::PyMemoryError::new_err("cannot allocate batch buffer"))?;
+    buf.resize(len, 0);
+    Ok(buf)
+}
+
+/// Fill `buf` with random 16-byte blocks carrying the version 4 / RFC 4122 bits
+fn fill_uuid4_bytes(buf: &mut [u8]) -> Result<(), getrandom::Error> {
+    getrandom::getrandom(buf)?;
+    for block in buf.chunks_exact_mut(16) {
+        block[6] = (block[6] & 0x0f) | 0x40;
+        block[8] = (block[8] & 0x3f) | 0x80;
+    }
+    Ok(())
+}
+
+fn random_error(e: getrandom::Error) -> PyErr {
+    pyo3::exceptions::PyOSError::new_err(format!("Failed to read random bytes: {}", e))
+}
+
+/// Generate `n` version 4 UUIDs entirely inside Rust and discard them
+///
+/// Used by the benchmark to measure raw generation throughput without the
+/// per-call FFI cost.
 #[pyfunction]
-fn uuid4_batch(count: usize) -> Vec<String> {
-    (0..count).map(|_| {
-        let uuid = Uuid::new_v4();
-        format_uuid_fast(&uuid)
-    }).collect()
+fn bench_uuid4(py: Python, n: usize) {
+    py.allow_threads(|| {
+        let mut sink = 0u8;
+        for _ in 0..n {
+            let uuid = Uuid::new_v4();
+            sink ^= uuid.as_bytes()[0];
+        }
+        std::hint::black_box(sink);
+    });
 }
 
+/// Do nothing and return `None`
+///
+/// Used by the benchmark as the baseline cost of one Python-to-Rust call.
+#[pyfunction]
+fn bench_noop() {}
+
 /// Fast UUID formatting without allocation overhead
+///
+/// Formats into a stack buffer and builds the Python string from it
+/// directly, skipping the intermediate Rust `String`.
+#[inline]
+fn format_uuid_fast<'py>(py: Python<'py>, uuid: &Uuid) -> &'py PyString {
+    let mut buf = [0u8; 36];
+    encode_hyphenated(uuid.as_bytes(), &mut buf);
+    // SAFETY: the buffer only holds ASCII hex digits and hyphens
+    PyString::new(py, unsafe { std::str::from_utf8_unchecked(&buf) })
+}
+
+/// Write the hyphenated form of `bytes` into `out` using the hex pair table
 #[inline]
-fn format_uuid_fast(uuid: &Uuid) -> String {
-    uuid.as_hyphenated().to_string()
+fn encode_hyphenated(bytes: &[u8; 16], out: &mut [u8; 36]) {
+    out[8] = b'-';
+    out[13] = b'-';
+    out[18] = b'-';
+    out[23] = b'-';
+    for (byte, &offset) in bytes.iter().zip(HYPHENATED_OFFSETS.iter()) {
+        out[offset..offset + 2].copy_from_slice(&HEX_PAIRS[*byte as usize]);
+    }
 }
 
 /// Helper function to parse namespace string or use predefined namespaces
@@ -87,6 +235,16 @@ fn parse_namespace(namespace: &str) -> PyResult<Uuid> {
     }
 }
 
+/// Helper function to parse a namespace given as raw bytes or ASCII text
+fn parse_namespace_bytes(namespace: &[u8]) -> PyResult<Uuid> {
+    if let Ok(bytes) = <[u8; 16]>::try_from(namespace) {
+        return Ok(Uuid::from_bytes(bytes));
+    }
+    let namespace = std::str::from_utf8(namespace)
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid namespace UUID: {}", e)))?;
+    parse_namespace(namespace)
+}
+
 /// Optimized UUID class that holds the UUID in binary format
 #[pyclass]
 struct FastUUID {
@@ -105,17 +263,22 @@ impl FastUUID {
         Ok(FastUUID { uuid })
     }
     
-    fn __str__(&self) -> String {
-        format_uuid_fast(&self.uuid)
+    fn __str__<'py>(&self, py: Python<'py>) -> &'py PyString {
+        format_uuid_fast(py, &self.uuid)
     }
     
     fn __repr__(&self) -> String {
-        format!("FastUUID('{}')", self.__str__())
+        format!("FastUUID('{}')", self.uuid.as_hyphenated())
     }
     
     #[getter]
-    fn hex(&self) -> String {
-        self.uuid.as_simple().to_string()
+    fn hex<'py>(&self, py: Python<'py>) -> &'py PyString {
+        let mut buf = [0u8; 32];
+        for (byte, dst) in self.uuid.as_bytes().iter().zip(buf.chunks_exact_mut(2)) {
+            dst.copy_from_slice(&HEX_PAIRS[*byte as usize]);
+        }
+        // SAFETY: the buffer only holds ASCII hex digits
+        PyString::new(py, unsafe { std::str::from_utf8_unchecked(&buf) })
     }
     
     #[getter]
@@ -131,22 +294,32 @@ impl FastUUID {
 
 /// Python module definition
 #[pymodule]
-fn rust_uuid(_py: Python, m: &PyModule) -> PyResult<()> {
+fn rust_uuid(py: Python, m: &PyModule) -> PyResult<()> {
     // Add functions
     m.add_function(wrap_pyfunction!(uuid1, m)?)?;
     m.add_function(wrap_pyfunction!(uuid3, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid3_bytes, m)?)?;
     m.add_function(wrap_pyfunction!(uuid4, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid4_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid4_int, m)?)?;
     m.add_function(wrap_pyfunction!(uuid5, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid5_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid7, m)?)?;
     m.add_function(wrap_pyfunction!(uuid4_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid4_batch_np, m)?)?;
+    m.add_function(wrap_pyfunction!(bench_uuid4, m)?)?;
+    m.add_function(wrap_pyfunction!(bench_noop, m)?)?;
+    
+    m.add("__version__", env!("CARGO_PKG_VERSION"))?;
     
     // Add FastUUID class
     m.add_class::<FastUUID>()?;
     
-    // Add namespace constants
-    m.add("NAMESPACE_DNS", NAMESPACE_DNS_UUID.to_string())?;
-    m.add("NAMESPACE_URL", NAMESPACE_URL_UUID.to_string())?;
-    m.add("NAMESPACE_OID", NAMESPACE_OID_UUID.to_string())?;
-    m.add("NAMESPACE_X500", NAMESPACE_X500_UUID.to_string())?;
+    // Add namespace constants as interned strings, created once at import
+    m.add("NAMESPACE_DNS", PyString::intern(py, &NAMESPACE_DNS_UUID.to_string()))?;
+    m.add("NAMESPACE_URL", PyString::intern(py, &NAMESPACE_URL_UUID.to_string()))?;
+    m.add("NAMESPACE_OID", PyString::intern(py, &NAMESPACE_OID_UUID.to_string()))?;
+    m.add("NAMESPACE_X500", PyString::intern(py, &NAMESPACE_X500_UUID.to_string()))?;
     
     Ok(())
 }
\ No newline at end of file